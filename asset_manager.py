@@ -1,12 +1,25 @@
+import os
+
 import pytmx
 
+SOUND_PROPERTY_PREFIX = "sfx_"
+SOUND_PRIORITY_PROPERTY = "sfx_priority"
+
 
 class AssetManager:
     def __init__(self, level, tile_types=None):
         if tile_types is None:
             tile_types = ["Player", "Item", "Platform"]
         self.tile_types = tile_types
+        self.sounds = {}
+
+        # O Tiled grava caminhos de arquivo relativos ao próprio arquivo .tmx
+        self.level_dir = ""
+        if level.filename:
+            self.level_dir = os.path.dirname(os.path.abspath(level.filename))
+
         self.tiles = self.load_tiles(level)
+        self.load_object_sounds(level)
         self.tile_width = level.tilewidth
         self.tile_height = level.tileheight
 
@@ -33,6 +46,7 @@ class AssetManager:
                 tile["collidable_vertical"] = tile.get("collidable_vertical", False)
                 tile["can_descend"] = tile.get("can_descend", False)
 
+                self.register_sounds(tile)
                 self.update_tiles(tile, tiles, gid_to_position.get(gid), level)
 
         return tiles
@@ -66,5 +80,42 @@ class AssetManager:
                     sprites.append(sprite)
         return sprites
 
+    def load_object_sounds(self, level):
+        # Objetos do Tiled também podem declarar efeitos sonoros
+        for obj in level.objects:
+            self.register_sounds(obj.properties)
+
+    def register_sounds(self, properties):
+        # Propriedades no formato 'sfx_<nome> = caminho/do/arquivo'
+        try:
+            priority = int(properties.get(SOUND_PRIORITY_PROPERTY, 0))
+        except (TypeError, ValueError):
+            print(
+                f"Prioridade de som inválida no mapa: "
+                f"{properties.get(SOUND_PRIORITY_PROPERTY)}"
+            )
+            priority = 0
+
+        for key, value in properties.items():
+            if key == SOUND_PRIORITY_PROPERTY or not key.startswith(
+                SOUND_PROPERTY_PREFIX
+            ):
+                continue
+
+            name = key[len(SOUND_PROPERTY_PREFIX) :]
+            if not isinstance(value, str):
+                print(f"Caminho de som inválido no mapa: {key} = {value}")
+                continue
+
+            sound = self.sounds.get(name)
+            if sound is None or priority > sound["priority"]:
+                self.sounds[name] = {
+                    "path": os.path.join(self.level_dir, value),
+                    "priority": priority,
+                }
+
     def get_asset(self, asset_type):
         return self.tiles.get(asset_type, [])
+
+    def get_sounds(self):
+        return self.sounds
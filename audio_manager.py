@@ -0,0 +1,182 @@
+import os
+import queue
+import threading
+
+import pygame
+
+DEFAULT_CHANNELS = 8
+MAX_PENDING_REQUESTS = 64
+
+
+class AudioManager:
+    def __init__(self, config_parser):
+        # Volume global de 0 a 100, convertido para a escala do Pygame (0.0 a 1.0)
+        volume = config_parser.getint("audio", "volume", fallback=100)
+        self.volume = max(0, min(volume, 100)) / 100.0
+        self.num_channels = config_parser.getint(
+            "audio", "channels", fallback=DEFAULT_CHANNELS
+        )
+        self.music_path = config_parser.get("audio", "music", fallback="")
+
+        self.base_dir = os.path.dirname(os.path.abspath(__file__))
+        self.sounds = {}
+        self.channels = []
+        self.channel_priorities = []
+        self.channel_started = []
+        self.play_counter = 0
+
+        # As requisições de reprodução são enfileiradas e atendidas por uma
+        # thread separada, para que o loop do jogo nunca espere pelo mixer
+        self.requests = queue.Queue(maxsize=MAX_PENDING_REQUESTS)
+        self.worker = None
+        self.enabled = self.init_mixer()
+
+        if self.enabled:
+            self.worker = threading.Thread(target=self.process_requests, daemon=True)
+            self.worker.start()
+
+    def init_mixer(self):
+        try:
+            if not pygame.mixer.get_init():
+                pygame.mixer.init()
+
+            # Reserva um conjunto fixo de canais exclusivo para os efeitos sonoros
+            pygame.mixer.set_num_channels(self.num_channels)
+            pygame.mixer.set_reserved(self.num_channels)
+            self.channels = [pygame.mixer.Channel(i) for i in range(self.num_channels)]
+            self.channel_priorities = [0] * self.num_channels
+            self.channel_started = [0] * self.num_channels
+
+            pygame.mixer.music.set_volume(self.volume)
+        except pygame.error as e:
+            print(f"Erro ao inicializar o áudio: {e}")
+            return False
+        return True
+
+    def resolve_path(self, path):
+        # Caminhos do config.ini são relativos ao diretório principal do script,
+        # como no Background
+        return os.path.join(self.base_dir, path)
+
+    def load_sounds(self, sounds):
+        # Decodifica todos os efeitos na carga do nível, e não durante o jogo
+        if not self.enabled:
+            return
+
+        # Os caminhos já chegam resolvidos pelo AssetManager. O dicionário é
+        # reconstruído a cada nível para não manter sons do mapa anterior
+        loaded_sounds = {}
+        for name, sound_data in sounds.items():
+            try:
+                sound = pygame.mixer.Sound(sound_data["path"])
+            except (pygame.error, FileNotFoundError) as e:
+                print(f"Erro ao carregar o efeito sonoro '{name}': {e}")
+                continue
+
+            sound.set_volume(self.volume)
+            loaded_sounds[name] = (sound, sound_data.get("priority", 0))
+
+        self.sounds = loaded_sounds
+
+    def play_sound(self, name):
+        if name not in self.sounds:
+            return
+        self.submit(("sound", name))
+
+    def play_music(self, path=None, loops=-1):
+        music_path = path or self.music_path
+        if not music_path:
+            return
+        self.submit(("music", self.resolve_path(music_path), loops))
+
+    def stop_music(self):
+        self.submit(("stop_music",))
+
+    def submit(self, request):
+        if not self.enabled:
+            return
+        try:
+            self.requests.put_nowait(request)
+        except queue.Full:
+            pass  # Descarta a requisição em vez de bloquear o loop do jogo
+
+    def process_requests(self):
+        while True:
+            request = self.requests.get()
+            if request is None:
+                break
+
+            try:
+                if request[0] == "sound":
+                    self.start_sound(request[1])
+                elif request[0] == "music":
+                    self.start_music(request[1], request[2])
+                elif request[0] == "stop_music":
+                    pygame.mixer.music.stop()
+            except Exception as e:
+                # Um erro não pode encerrar a thread, ou todo o áudio pararia
+                print(f"Erro ao reproduzir áudio: {e}")
+
+    def start_sound(self, name):
+        sound_data = self.sounds.get(name)
+        if sound_data is None:
+            return  # Som removido por uma recarga de nível
+
+        sound, priority = sound_data
+        index = self.find_channel(priority)
+        if index is None:
+            return  # Todos os canais ocupados por sons mais importantes
+
+        self.play_counter += 1
+        self.channel_priorities[index] = priority
+        self.channel_started[index] = self.play_counter
+        self.channels[index].play(sound)
+
+    def find_channel(self, priority):
+        victim = None
+        for index, channel in enumerate(self.channels):
+            if not channel.get_busy():
+                return index
+
+            # Rouba a voz de menor prioridade; em caso de empate, a mais antiga
+            if victim is None or (
+                self.channel_priorities[index],
+                self.channel_started[index],
+            ) < (
+                self.channel_priorities[victim],
+                self.channel_started[victim],
+            ):
+                victim = index
+
+        if victim is not None and self.channel_priorities[victim] <= priority:
+            return victim
+        return None
+
+    def start_music(self, music_path, loops):
+        # pygame.mixer.music lê o arquivo aos poucos do disco em vez de
+        # decodificá-lo inteiro na memória
+        if not os.path.exists(music_path):
+            print(f"Música não encontrada: {music_path}")
+            return
+        pygame.mixer.music.load(music_path)
+        pygame.mixer.music.play(loops)
+
+    def shutdown(self):
+        if self.worker is None:
+            return
+
+        # Descarta as requisições pendentes e avisa a thread para encerrar,
+        # sem nunca bloquear caso a fila esteja cheia
+        while True:
+            try:
+                self.requests.get_nowait()
+            except queue.Empty:
+                break
+        try:
+            self.requests.put_nowait(None)
+        except queue.Full:
+            pass
+        self.worker.join(timeout=1.0)
+        self.worker = None
+        pygame.mixer.music.stop()
+        pygame.mixer.stop()
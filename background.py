@@ -60,6 +60,6 @@ class Background:
         if self.y_offset > self.background_image.get_height():
             self.y_offset = 0
 
-    def render(self, screen, block_size):
-        # Blita a imagem de fundo na posição atual
-        screen.blit(self.background_image, (0, -self.y_offset))
+    def get_draw_commands(self, block_size):
+        # Imagem de fundo na posição atual
+        return [(self.background_image, (0, -self.y_offset))]
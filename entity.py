@@ -20,15 +20,13 @@ class Tile:
             self.current_frame = (self.current_frame + 1) % len(self.sprites)
             self.timer_next_frame -= frame_duration  # Reseta o temporizador
 
-    def render(self, screen, block_size):
-        for pos in self.position:
-            screen.blit(
-                self.sprites[self.current_frame],
-                (
-                    pos[0] * block_size[0],
-                    pos[1] * block_size[1],
-                ),
-            )
+    def get_draw_commands(self, block_size):
+        # Lista de (sprite, posição) pronta para ser desenhada com screen.blits
+        sprite = self.sprites[self.current_frame]
+        return [
+            (sprite, (pos[0] * block_size[0], pos[1] * block_size[1]))
+            for pos in self.position
+        ]
 
     def get_rect(self, block_size):
         # Retorna uma lista de pygame.Rect para cada posição
@@ -51,9 +49,11 @@ class Entity:
             tile = Tile(t)
             self.tiles.append(tile)
 
-    def render(self, screen, block_size):
+    def get_draw_commands(self, block_size):
+        draw_commands = []
         for tile in self.tiles:
-            tile.render(screen, block_size)
+            draw_commands.extend(tile.get_draw_commands(block_size))
+        return draw_commands
 
     def update(self, delta_time):
         for tile in self.tiles:
@@ -0,0 +1,36 @@
+from concurrent.futures import ThreadPoolExecutor
+
+
+class FramePipeline:
+    def __init__(self, game):
+        self.game = game
+        self.executor = ThreadPoolExecutor(max_workers=1)
+        self.pending_frame = None
+
+    def simulate_frame(self, delta_time, input_snapshot):
+        # Executado na thread de simulação: atualiza o jogo e congela o
+        # resultado em uma lista de desenho que não é mais alterada
+        self.game.simulate(delta_time, input_snapshot)
+        return self.game.get_draw_commands()
+
+    def step(self, delta_time, input_handler):
+        # Recebe o quadro N já simulado e dispara a simulação do quadro N+1,
+        # que roda enquanto a thread principal desenha e apresenta o quadro N
+        if self.pending_frame is None:
+            draw_commands = self.game.get_draw_commands()
+        else:
+            draw_commands = self.pending_frame.result()
+
+        self.pending_frame = self.executor.submit(
+            self.simulate_frame, delta_time, input_handler.snapshot()
+        )
+        return draw_commands
+
+    def shutdown(self):
+        # Repassa erros da última simulação, mas sempre libera a thread
+        try:
+            if self.pending_frame is not None:
+                self.pending_frame.result()
+        finally:
+            self.pending_frame = None
+            self.executor.shutdown(wait=True)
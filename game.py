@@ -4,6 +4,7 @@ import configparser
 
 # Importações dos módulos atualizados
 from asset_manager import AssetManager
+from audio_manager import AudioManager
 from player import Player
 from item import Item
 from platformer import Platform
@@ -25,6 +26,8 @@ class Game:
 
         self.screen = None
         self.background = None
+        self.audio_manager = AudioManager(self.config_parser)
+        self.player_state = None
 
         # Variável para controlar se a tela precisa ser atualizada
         self.screen_needs_update = True
@@ -48,6 +51,7 @@ class Game:
             self.tiled_level = pytmx.load_pygame(level_filename)
             self.load_assets()
             self.background = Background(self.tiled_level, self.config_parser)
+            self.audio_manager.play_music()
         except Exception as e:
             print(f"Erro ao carregar o nível: {e}")
 
@@ -57,15 +61,25 @@ class Game:
         self.player = Player(self.asset_manager.get_asset("Player"))
         self.item = Item(self.asset_manager.get_asset("Item"))
         self.platform = Platform(self.asset_manager.get_asset("Platform"))
+        self.player_state = self.player.state
+
+        self.audio_manager.load_sounds(self.asset_manager.get_sounds())
 
     def get_block_size(self):
         return self.tiled_level.tilewidth, self.tiled_level.tileheight
 
-    def update(self, delta_time, input_handler):
+    def update(self, delta_time, input_handler, frame_input=None):
+        # frame_input permite simular com outra entrada (ex: uma InputSnapshot)
+        self.handle_display_events(input_handler)
+        self.simulate(delta_time, frame_input or input_handler)
+
+    def handle_display_events(self, input_handler):
+        # Alterações na janela precisam acontecer na thread principal
         if input_handler.fullscreen_toggled:
             self.toggle_fullscreen()
             input_handler.reset_toggle_fullscreen()
 
+    def simulate(self, delta_time, input_handler):
         if self.background:
             self.background.update(delta_time)
 
@@ -78,17 +92,29 @@ class Game:
         if self.player:
             self.player.update(delta_time, input_handler, self.platform.tiles)
 
+            # Toca o efeito sonoro associado ao novo estado do jogador (ex: 'sfx_jump')
+            if self.player.state != self.player_state:
+                self.player_state = self.player.state
+                self.audio_manager.play_sound(self.player_state)
+
     def render(self, screen):
+        screen.blits(self.get_draw_commands(), doreturn=False)
+
+    def get_draw_commands(self):
+        # Monta a lista completa de desenho do quadro, na ordem de renderização
         block_size = self.get_block_size()
+        draw_commands = []
 
         if self.background:
-            self.background.render(screen, block_size)
+            draw_commands.extend(self.background.get_draw_commands(block_size))
 
         if self.item:
-            self.item.render(screen, block_size)
+            draw_commands.extend(self.item.get_draw_commands(block_size))
 
         if self.platform:
-            self.platform.render(screen, block_size)
+            draw_commands.extend(self.platform.get_draw_commands(block_size))
 
         if self.player:
-            self.player.render(screen, block_size)
+            draw_commands.extend(self.player.get_draw_commands(block_size))
+
+        return draw_commands
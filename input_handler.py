@@ -1,6 +1,17 @@
 import pygame
 
 
+class InputSnapshot:
+    def __init__(self, key_state):
+        self.key_state = dict(key_state)
+
+    def is_pressed(self, action):
+        return self.key_state.get(action, False)
+
+    def snapshot(self):
+        return InputSnapshot(self.key_state)
+
+
 class InputHandler:
     def __init__(self, config_parser):
         self.quit_game = False
@@ -58,5 +69,9 @@ class InputHandler:
     def is_pressed(self, action):
         return self.key_state.get(action, False)
 
+    def snapshot(self):
+        # Cópia do estado das teclas para uso fora da thread principal
+        return InputSnapshot(self.key_state)
+
     def reset_toggle_fullscreen(self):
         self.fullscreen_toggled = False
@@ -2,9 +2,10 @@
 import pygame
 import logging
 
+from frame_pipeline import FramePipeline
 from game import Game
-from input_handler import InputHandler
-from utils import render_fps, read_config_file
+from input_handler import InputHandler, InputSnapshot
+from utils import FrameTimer, render_fps, read_config_file
 
 logger = logging.getLogger(__name__)
 logging.basicConfig(
@@ -13,6 +14,8 @@ logging.basicConfig(
     datefmt="%H:%M:%S",
 )
 
+LEVEL_FILENAME = "maps/level1.tmx"
+
 pygame.init()
 pygame.font.init()
 
@@ -22,7 +25,7 @@ game = Game(config_parser=config_parser)
 game.load_screen()
 game.screen.set_colorkey((0, 0, 0))  # define transparente
 
-game.load_level("maps/level1.tmx")
+game.load_level(LEVEL_FILENAME)
 logger.info("Nível carregado")
 
 input_handler = InputHandler(config_parser)
@@ -33,15 +36,55 @@ running = True
 # Carrega a fonte uma vez para uso no render_fps
 font = pygame.font.Font(None, 30)
 
-while running:
-    delta_time = clock.tick(60) / 1000.0  # tempo em segundos desde o último frame
+# Modo de execução do quadro: 'serial', 'pipelined' ou 'compare'
+FRAME_MODES = ["serial", "pipelined", "compare"]
+DEFAULT_COMPARE_FRAMES = 600
+
+# No modo 'compare', as duas fases usam o mesmo passo de tempo e a mesma
+# sequência de teclas, repetida em ciclo: (quadros, ações pressionadas)
+COMPARE_DELTA_TIME = 1 / 60
+COMPARE_INPUT_SCRIPT = [
+    (60, ["right"]),
+    (20, ["right", "up"]),
+    (40, []),
+    (60, ["left"]),
+    (20, ["up"]),
+    (40, []),
+]
+
+frame_mode = config_parser.get("performance", "frame_mode", fallback="serial")
+if frame_mode not in FRAME_MODES:
+    logger.warning(f"Modo de quadro inválido no arquivo de configuração: {frame_mode}")
+    frame_mode = "serial"
+compare_frames = config_parser.getint(
+    "performance", "compare_frames", fallback=DEFAULT_COMPARE_FRAMES
+)
+if compare_frames < 1:
+    logger.warning(
+        f"Número de quadros de comparação inválido no arquivo de configuração: "
+        f"{compare_frames}"
+    )
+    compare_frames = DEFAULT_COMPARE_FRAMES
 
-    input_handler.process_events()
+pipeline = None
+if frame_mode in ("pipelined", "compare"):
+    pipeline = FramePipeline(game)
 
-    if input_handler.quit_game:
-        running = False
+frame_timers = {"serial": FrameTimer(), "pipelined": FrameTimer()}
+current_mode = "serial" if frame_mode == "compare" else frame_mode
+compare_frame = 0
+
+
+def scripted_input(frame_index):
+    frame_index %= sum(frames for frames, _ in COMPARE_INPUT_SCRIPT)
+    for frames, actions in COMPARE_INPUT_SCRIPT:
+        if frame_index < frames:
+            return InputSnapshot({action: True for action in actions})
+        frame_index -= frames
 
-    game.update(delta_time, input_handler)
+
+def run_serial_frame(delta_time, frame_input):
+    game.update(delta_time, input_handler, frame_input)
 
     # Clear the screen with a background color
     game.screen.fill((0, 0, 0))
@@ -54,5 +97,81 @@ while running:
 
     pygame.display.update()
 
+
+def run_pipelined_frame(delta_time, frame_input):
+    game.handle_display_events(input_handler)
+
+    # Desenha o quadro N enquanto o quadro N+1 é simulado em outra thread
+    draw_commands = pipeline.step(delta_time, frame_input)
+
+    game.screen.fill((0, 0, 0))
+    game.screen.blits(draw_commands, doreturn=False)
+    render_fps(clock.get_fps(), game.screen, font)
+
+    pygame.display.update()
+
+
+def log_frame_times():
+    for mode, timer in frame_timers.items():
+        if timer.frames:
+            logger.info(
+                f"Período médio do loop ({mode}): {timer.average_ms():.2f} ms "
+                f"em {timer.frames} quadros"
+            )
+
+    serial_ms = frame_timers["serial"].average_ms()
+    pipelined_ms = frame_timers["pipelined"].average_ms()
+    if serial_ms and pipelined_ms:
+        logger.info(f"Ganho do modo pipelined: {serial_ms / pipelined_ms:.2f}x")
+    logger.info("Valores apenas indicativos: variam com a máquina e a carga do sistema")
+
+
+if frame_mode == "compare":
+    frame_timers["serial"].lap()
+
+while running:
+    if frame_mode == "compare":
+        # Sem limite de FPS, para que o período medido seja o trabalho real
+        clock.tick()
+        delta_time = COMPARE_DELTA_TIME
+    else:
+        delta_time = clock.tick(60) / 1000.0  # tempo em segundos desde o último frame
+
+    input_handler.process_events()
+
+    if input_handler.quit_game:
+        running = False
+
+    frame_input = input_handler
+    if frame_mode == "compare":
+        frame_input = scripted_input(compare_frame)
+
+    if current_mode == "pipelined":
+        run_pipelined_frame(delta_time, frame_input)
+    else:
+        run_serial_frame(delta_time, frame_input)
+
+    # No modo 'compare', mede os dois loops em sequência e encerra o jogo
+    if frame_mode == "compare":
+        frame_timers[current_mode].lap()
+        compare_frame += 1
+
+        if compare_frame == compare_frames:
+            if current_mode == "serial":
+                # Recarrega o nível para que a fase pipelined parta do mesmo estado
+                game.load_level(LEVEL_FILENAME)
+                current_mode = "pipelined"
+                compare_frame = 0
+                frame_timers["pipelined"].lap()
+            else:
+                running = False
+
 # Clean up and quit
-pygame.quit()
+try:
+    if pipeline:
+        pipeline.shutdown()
+    if frame_mode == "compare":
+        log_frame_times()
+finally:
+    game.audio_manager.shutdown()
+    pygame.quit()
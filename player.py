@@ -52,7 +52,8 @@ class Player(Entity):
             tile.animation_name = animation_name
             self.tiles.append(tile)
 
-    def render(self, screen, block_size):
+    def get_draw_commands(self, block_size):
+        draw_commands = []
         for tile in self.tiles:
             if self.state == tile.animation_name:
                 sprite_to_draw = tile.sprites[tile.current_frame]
@@ -60,10 +61,10 @@ class Player(Entity):
                 if self.face_direction == "left":
                     sprite_to_draw = pygame.transform.flip(sprite_to_draw, True, False)
 
-                screen.blit(
-                    sprite_to_draw,
-                    (self.x * block_size[0], self.y * block_size[1]),
+                draw_commands.append(
+                    (sprite_to_draw, (self.x * block_size[0], self.y * block_size[1]))
                 )
+        return draw_commands
 
     def update(self, delta_time, input_handler, tiles):
         self.update_state_and_velocity(input_handler, delta_time, tiles)
@@ -1,6 +1,7 @@
 # utils.py
 import pygame
 import configparser
+import time
 
 
 def render_fps(fps, screen, font):
@@ -12,3 +13,24 @@ def read_config_file(ini_file):
     parser = configparser.ConfigParser()
     parser.read(ini_file)
     return parser
+
+
+class FrameTimer:
+    def __init__(self):
+        self.total_time = 0.0
+        self.frames = 0
+        self.last_time = None
+
+    def lap(self):
+        # Mede o período completo do loop entre duas chamadas consecutivas;
+        # a primeira chamada apenas marca o início da medição
+        now = time.perf_counter()
+        if self.last_time is not None:
+            self.total_time += now - self.last_time
+            self.frames += 1
+        self.last_time = now
+
+    def average_ms(self):
+        if self.frames == 0:
+            return 0.0
+        return self.total_time / self.frames * 1000.0